@@ -5,11 +5,14 @@ adjacent if they are distinct and connected by a horizontal or vertical line wit
 """
 
 from dataclasses import dataclass, field
-from typing import ClassVar
+from functools import lru_cache
+from io import StringIO
+from random import Random
+from typing import ClassVar, Iterable, Iterator
 
-from .graph import Undirected
+from .graph import Edges, Nodes, Undirected
 from .intersection import Intersection
-from .stone import Stone
+from .stone import Color, Stone, glyphs
 
 
 class Board(Undirected):
@@ -24,45 +27,549 @@ class Board(Undirected):
 
     Though 19×19 boards are standard, go can be played on another size board. Particularly common sizes for quick games are 9×9 and
     13×13.
+
+    The graph holds the intersections of the board (its topology) while their colors are kept apart as two bitboards, one per
+    color, with a bit per intersection in the same flat layout. Stones are made on demand out of an intersection and its color.
     """
 
-    neighbors: set[Intersection] = {
+    neighbors: ClassVar[tuple[Intersection, ...]] = (
         Intersection(+1, 00),  # east
         Intersection(00, +1),  # north
         Intersection(-1, 00),  # west
         Intersection(00, -1),  # south
-    }
+    )
 
     def __init__(self, size: int = 9):
         """Build board."""
         self.size = size
         self.range = range(-self.size, self.size + 1)
+        self.width = len(self.range)
 
-        self.stones = [
-            [
-                Stone(
-                    file,
-                    rank,
-                ) for rank in self.range
-            ] for file in self.range
-        ]
-
-    #   Build neighborhoods.
-        super(Board, self).__init__(
-            {
-                node: {
-                    node + neighbor for neighbor in self.neighbors
-                } for rank in self.stones for node in rank
-            }
-        )
+    #   Intersections laid flat rank after rank, each found at its offset.
+        self.points = intersections(self.size)
+
+    #   Geometry shared by all boards this size.
+        self.adjacencies = adjacencies(self.size)
+        self.neighborhoods = neighborhoods(self.size)
+        self.borders = borders(self.size)
+
+    #   Occupancy of intersections by either color as bitboards in the same layout, all empty at first.
+        self.black = 0
+        self.white = 0
+
+    #   Zobrist hash of the position, updated stone by stone.
+        self.zobrist = 0
+
+    #   Groups of connected stones as a disjoint-set forest over offsets, with the group of each root kept as a bitboard.
+        self.parents = list(range(len(self.points)))
+        self.groups = {}
+
+    #   Share neighborhoods of boards this size, which are symmetric and free of self-edges by construction.
+        super(Board, self).__init__(topology(self.size), symmetric=True, validated=True)
 
     def __repr__(self):
         """Draw a board."""
-        return \
-            "\n    -9-8-7-6-5-4-3-2-1 0+1+2+3+4+5+6+7+8+9    \n\n" + \
-            "\n".join(
-                f"{rank:+2d}  " + "".join(
-                    repr(self.stones[rank][file]) for file in self.range
-                ) + f"  {rank:+2d}" for rank in self.range
-            ) + \
-            "\n\n    -9-8-7-6-5-4-3-2-1 0+1+2+3+4+5+6+7+8+9    \n"
+        files = "".join(f"{file:+2d}" if file else " 0" for file in self.range)
+
+    #   Write the drawing in one buffer.
+        drawing = StringIO()
+        write = drawing.write
+
+        write(f"\n    {files}    \n\n")
+
+    #   Pucs come straight out of the bitboards by value.
+        for rank, offset in zip(self.range, range(0, len(self.points), self.width)):
+            write(f"{rank:+2d}  ")
+
+            for index in range(offset, offset + self.width):
+                write(glyphs[(self.black >> index & 1) - (self.white >> index & 1) + 1])
+
+            write(f"  {rank:+2d}\n")
+
+        write(f"\n    {files}    \n")
+
+        return drawing.getvalue()
+
+    def __hash__(self):
+        """Hash position, not topology."""
+        return self.zobrist
+
+    def __eq__(self, other):
+        """Compare positions, hashes first, as a few integer comparisons.
+
+        Boards are only ever equal to boards, whatever else may compare as graphs.
+        """
+        return isinstance(other, Board) and self.zobrist == other.zobrist and self.size == other.size \
+            and self.black == other.black and self.white == other.white
+
+    def __ne__(self, other):
+        """Compare positions, hashes first."""
+        return not self == other
+
+    def __le__(self, other):
+        """Is board topology a subgraph of the other."""
+        return self.issubset(other)
+
+    def __ge__(self, other):
+        """Is board topology a supergraph of the other."""
+        return self.issuperset(other)
+
+    def __lt__(self, other):
+        """Is board topology a strict subgraph of the other, whatever the positions."""
+        return self.issubset(other) and not dict.__eq__(self, other)
+
+    def __gt__(self, other):
+        """Is board topology a strict supergraph of the other, whatever the positions."""
+        return self.issuperset(other) and not dict.__eq__(self, other)
+
+    def snapshot(self) -> tuple[int, int]:
+        """Snapshot of the board position as its two bitboards, to compare with later positions without copying the board."""
+        return self.black, self.white
+
+    def copy(self):
+        """Copy board position.
+
+        Board topology is frozen, so neighborhoods are shared with the copy. Bitboards are plain integers, so copying them is free.
+        """
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+
+    #   Disjoint sets are the only mutable part of a position.
+        board.parents = self.parents.copy()
+        board.groups = self.groups.copy()
+
+    #   Share neighborhoods, which are frozen.
+        dict.update(board, self)
+
+        return board
+
+    def __contains__(self, node) -> bool:
+        """Check if the intersection, or the intersection a stone is on, is on the board."""
+        return super(Board, self).__contains__(Intersection(node.file, node.rank, node.size) if isinstance(node, Stone) else node)
+
+    def __getitem__(self, node: Intersection) -> Nodes:
+        """Get the neighborhood of the intersection, or of the intersection a stone is on.
+
+        Board topology is keyed by plain intersections, which stones never equal, so stones are turned into them first.
+        """
+        return super(Board, self).__getitem__(Intersection(node.file, node.rank, node.size) if isinstance(node, Stone) else node)
+
+    def get(self, node: Intersection, default_neighborhood: Nodes | None = None) -> Nodes:
+        """Get the neighborhood of the intersection, or of the intersection a stone is on, if on the board."""
+        return super(Board, self).get(
+            Intersection(node.file, node.rank, node.size) if isinstance(node, Stone) else node, default_neighborhood
+        )
+
+    def graph(self) -> Undirected:
+        """Topology of the board as a plain undirected graph, with neighborhoods of its own to change freely."""
+        return Undirected({node: set(neighborhood) for node, neighborhood in self.items()}, validated=True)
+
+    def fixed(self, *args, **kwargs):
+        """Board topology is shared by all boards the same size, so it cannot be changed."""
+        raise TypeError(f"{self.__class__.__name__} topology cannot be changed, change a copy of its graph instead")
+
+    __setitem__ = __delitem__ = setdefault = add = pop = popitem = update = clear = fixed
+
+    del fixed
+
+    def union(self, other) -> Undirected:
+        """Unite board topology with a graph."""
+        return self.graph().union(other)
+
+    def difference(self, other) -> Undirected:
+        """Subtract graph from board topology."""
+        return self.graph().difference(other)
+
+    def intersection(self, other) -> Undirected:
+        """Intersect board topology with a graph."""
+        return self.graph().intersection(other)
+
+    def symmetric_difference(self, other) -> Undirected:
+        """Complement union of board topology and a graph with their intersection."""
+        return self.graph().symmetric_difference(other)
+
+    @classmethod
+    def load(cls, filename: str):
+        """Load board position from file, size first and then the colors of intersections rank after rank."""
+        with open(filename) as board_file:
+            size, *colors = board_file.read().split()
+
+        board = cls(int(size))
+        board.fill(map(int, colors))
+
+        return board
+
+    @classmethod
+    def random(cls, size: int = 9, seed: int | None = None):
+        """Make a board with a random position, the same one every time for the same seed if given.
+
+        Colors are drawn all at once and filled in together.
+        """
+        board = cls(size)
+        board.fill(Random(seed).choices(tuple(Color), k=len(board.points)))
+
+        return board
+
+    def save(self, filename: str):
+        """Save board position to file, size first and then the colors of intersections rank after rank."""
+        black = self.black
+        white = self.white
+
+        with open(filename, "w") as board_file:
+            board_file.write(f"{self.size}\n")
+
+        #   Colors come straight out of the bitboards by value.
+            for offset in range(0, len(self.points), self.width):
+                board_file.write(
+                    " ".join(
+                        f"{(black >> index & 1) - (white >> index & 1):+d}" for index in range(offset, offset + self.width)
+                    ) + "\n"
+                )
+
+    def index(self, intersection: Intersection) -> int:
+        """Offset of intersection in the flat (rank-major) layout of the board."""
+        return (intersection.rank + self.size) * self.width + (intersection.file + self.size)
+
+    def stone(self, intersection: Intersection) -> Stone:
+        """Get the stone on an intersection in constant time.
+
+        Raises:
+            ValueError: If the intersection is off the board, or meant for a board of another size.
+        """
+        if not intersection or intersection.size != self.size:
+            raise ValueError(
+                f"({intersection.file:+d}, {intersection.rank:+d}) of size {intersection.size} is off a board of size {self.size}"
+            )
+
+        bit = 1 << self.index(intersection)
+
+        return Stone(
+            intersection.file,
+            intersection.rank, size=self.size, color=(
+                Color.black if self.black & bit else
+                Color.white if self.white & bit else Color.empty
+            )
+        )
+
+    def put(self, stone: Stone):
+        """Put stone on its intersection, replacing whatever was there.
+
+        Raises:
+            ValueError: If the stone is off the board, or meant for a board of another size.
+        """
+        if not stone or stone.size != self.size:
+            raise ValueError(f"({stone.file:+d}, {stone.rank:+d}) of size {stone.size} is off a board of size {self.size}")
+
+        index = self.index(stone)
+        bit = 1 << index
+        lifted = (self.black | self.white) & bit
+        black_keys, white_keys = zobrist(self.size)
+
+    #   Hash out whatever was there.
+        if self.black & bit:
+            self.zobrist ^= black_keys[index]
+
+        elif self.white & bit:
+            self.zobrist ^= white_keys[index]
+
+    #   Hash in the stone.
+        if stone.color == Color.black:
+            self.zobrist ^= black_keys[index]
+
+        elif stone.color == Color.white:
+            self.zobrist ^= white_keys[index]
+
+    #   Set the bit of the color of the stone and clear the other in one go.
+        self.black = self.black | bit if stone.color == Color.black else self.black & ~bit
+        self.white = self.white | bit if stone.color == Color.white else self.white & ~bit
+
+    #   Disjoint sets cannot be split, so lifting a stone (a capture) regroups only what is left of its group from scratch.
+        if lifted:
+            self.regroup(self.groups.pop(self.find(index)) & ~bit)
+            self.parents[index] = index
+
+    #   Placing a stone only joins it to the groups next to it.
+        if stone.color:
+            self.groups[index] = bit
+
+            for adjacent_index in self.offsets(
+                self.neighborhoods[index] & (self.black if stone.color == Color.black else self.white)
+            ):
+                self.join(index, adjacent_index)
+
+    def fill(self, colors: Iterable[int]):
+        """Set the colors of all intersections at once, in the flat layout of the board, replacing the whole position.
+
+        Colors are set straight on the bitboards, and stones are grouped once at the end.
+
+        Raises:
+            ValueError: If there are not as many colors as intersections, or any of them is not a color.
+        """
+        colors = tuple(colors)
+
+        if len(colors) != len(self.points):
+            raise ValueError(f"{len(colors)} colors given for {len(self.points)} intersections")
+
+        if invalid := set(colors).difference(Color):
+            raise ValueError(f"invalid colors {sorted(invalid)}, colors are {sorted(map(int, Color))}")
+
+        black_keys, white_keys = zobrist(self.size)
+
+        self.black = 0
+        self.white = 0
+        self.zobrist = 0
+
+        for index, color in enumerate(colors):
+            if color == Color.black:
+                self.black |= 1 << index
+                self.zobrist ^= black_keys[index]
+
+            elif color == Color.white:
+                self.white |= 1 << index
+                self.zobrist ^= white_keys[index]
+
+        self.regroup()
+
+    def bitboard(self, intersections: Iterable[Intersection]) -> int:
+        """Bitboard of given intersections."""
+        bits = 0
+
+        for intersection in intersections:
+            bits |= 1 << self.index(intersection)
+
+        return bits
+
+    def offsets(self, bits: int) -> Iterator[int]:
+        """Offsets of the intersections in the given bitboard, lowest first.
+
+        Use `self.points[offset]` to get the intersections themselves where needed, and bitboards everywhere else.
+        """
+        while bits:
+            bit = bits & -bits
+            yield bit.bit_length() - 1
+            bits ^= bit
+
+    def find(self, index: int) -> int:
+        """Offset of the root of the group of the stone at given offset, halving the path to it along the way."""
+        while self.parents[index] != index:
+            self.parents[index] = self.parents[self.parents[index]]
+            index = self.parents[index]
+
+        return index
+
+    def join(self, index: int, other_index: int):
+        """Join the groups of the stones at given offsets, hanging the smaller group from the root of the larger one."""
+        root = self.find(index)
+        other_root = self.find(other_index)
+
+        if root != other_root:
+            if self.groups[root].bit_count() < self.groups[other_root].bit_count():
+                root, other_root = other_root, root
+
+            self.parents[other_root] = root
+            self.groups[root] |= self.groups.pop(other_root)
+
+    def regroup(self, bits: int | None = None):
+        """Group the stones in the given bitboard from scratch, flooding one group at a time over the bitboards.
+
+        Stones in the bitboard must make up whole groups, or be all that is left of some. Without a bitboard, all stones on the
+        board are grouped from scratch.
+        """
+        if bits is None:
+            self.parents = list(range(len(self.points)))
+            self.groups = {}
+            bits = self.black | self.white
+
+        parents = self.parents
+        offsets = self.offsets
+
+        for bitboard in (self.black & bits, self.white & bits):
+            while bitboard:
+                group = self.flood(bitboard & -bitboard, bitboard)  # Flood from the lowest stone left.
+                root = (group & -group).bit_length() - 1
+
+            #   Hang every stone of the group straight from its root.
+                self.groups[root] = group
+
+                for index in offsets(group):
+                    parents[index] = root
+
+                bitboard &= ~group
+
+    def group(self, intersection: Intersection) -> int:
+        """Bitboard of the stones connected to the one on the intersection, if any."""
+        index = self.index(intersection)
+
+        return self.groups[self.find(index)] if (self.black | self.white) >> index & 1 else 0
+
+    @property
+    def empty(self) -> int:
+        """Bitboard of empty intersections."""
+        return ((1 << len(self.points)) - 1) & ~(self.black | self.white)
+
+    def around(self, bits: int) -> int:
+        """Bitboard of intersections adjacent to the ones in the given bitboard but not in it."""
+        east, north, west, south = self.borders
+
+        return (
+            (bits & east) << 1 |
+            (bits & north) << self.width |
+            (bits & west) >> 1 |
+            (bits & south) >> self.width
+        ) & ~bits
+
+    def flood(self, bits: int, within: int) -> int:
+        """Spread the given bitboard to adjacent intersections within another bitboard, until it stops growing."""
+        around = self.around
+
+        while (flooded := bits | around(bits) & within) != bits:
+            bits = flooded
+
+        return bits
+
+    @property
+    def edge_list(self) -> Edges:
+        """List edges in board as pairs of adjacent intersections, cached per size like its frozen topology."""
+        return edges(self.size)
+
+    def adjacent(self, node: Intersection, other_node: Intersection) -> bool:
+        """Check if two intersections are adjacent, by a single bit of the bitboard neighborhood of one."""
+        return bool(self.neighborhoods[self.index(node)] >> self.index(other_node) & 1)
+
+    def cluster(self, node: Intersection) -> Nodes:
+        """Get cluster node belong to, flooding bitboards."""
+        return Nodes(
+            self.points[offset] for offset in self.offsets(
+                self.flood(1 << self.index(node), (1 << len(self.points)) - 1)
+            )
+        )
+
+    def boundary(self, cluster: Nodes) -> Nodes:
+        """Get all intersections not in the cluster but adjacent to it, through bitboards."""
+        return Nodes(self.points[offset] for offset in self.offsets(self.around(self.bitboard(cluster))))
+
+    def liberties(self, bits: int) -> int:
+        """Bitboard of liberties of the stones in the given bitboard, namely the empty intersections adjacent to them."""
+        return self.around(bits) & self.empty
+
+    def has_liberty(self, bits: int) -> bool:
+        """Check if the stones in the given bitboard have any liberty, stopping at the first direction that has one."""
+        east, north, west, south = self.borders
+        empty = self.empty
+
+        return bool(
+            (bits & east) << 1 & empty or
+            (bits & north) << self.width & empty or
+            (bits & west) >> 1 & empty or
+            (bits & south) >> self.width & empty
+        )
+
+    def captives(self, bits: int) -> int:
+        """Bitboard of the groups of the stones in the given bitboard that have no liberties, namely the stones to capture.
+
+        Liberties are checked once per group over the bitboards.
+        """
+        captives = 0
+
+        for group in self.groups.values():
+            if group & bits and not self.has_liberty(group):
+                captives |= group
+
+        return captives
+
+
+@lru_cache(maxsize=None)
+def intersections(size: int) -> tuple[Intersection, ...]:
+    """Intersections of a board of given size, laid flat rank after rank.
+
+    Board geometry only depends on its size, so it is computed once per size and shared by all boards.
+    """
+    return tuple(
+        Intersection(
+            file,
+            rank, size=size
+        ) for rank in range(-size, size + 1) for file in range(-size, size + 1)
+    )
+
+
+@lru_cache(maxsize=None)
+def adjacencies(size: int) -> tuple[tuple[int, ...], ...]:
+    """Offsets of the intersections adjacent to each intersection of a board of given size, in the flat layout of the board.
+
+    Neighbors are found by offset arithmetic on plain integers, with intersections out of the board clipped.
+    """
+    width = 2 * size + 1
+
+    return tuple(
+        tuple(
+            index + neighbor.rank * width + neighbor.file for neighbor in Board.neighbors
+            if 0 <= index % width + neighbor.file < width and 0 <= index // width + neighbor.rank < width
+        ) for index in range(width * width)
+    )
+
+
+@lru_cache(maxsize=None)
+def topology(size: int) -> dict[Intersection, Nodes]:
+    """Neighborhoods of the intersections of a board of given size, shared by all boards this size and frozen."""
+    points = intersections(size)
+
+    return {
+        point: Nodes(
+            points[adjacent_index] for adjacent_index in adjacency
+        ) for point, adjacency in zip(points, adjacencies(size))
+    }
+
+
+@lru_cache(maxsize=None)
+def edges(size: int) -> Edges:
+    """Edges of a board of given size as pairs of adjacent intersections, both ways."""
+    points = intersections(size)
+
+    return Edges(
+        (point, points[adjacent_index]) for point, adjacency in zip(points, adjacencies(size)) for adjacent_index in adjacency
+    )
+
+
+@lru_cache(maxsize=None)
+def neighborhoods(size: int) -> tuple[int, ...]:
+    """Bitboards of the intersections adjacent to each intersection of a board of given size, in the flat layout of the board.
+
+    Neighbors of a given color are then a single AND away.
+    """
+    return tuple(sum(1 << index for index in adjacency) for adjacency in adjacencies(size))
+
+
+@lru_cache(maxsize=None)
+def borders(size: int) -> tuple[int, int, int, int]:
+    """Bitboards of intersections having a neighbor to the east, north, west and south respectively, for a board of given size.
+
+    A bitboard shifted by one file or rank spills over the edges of the board, unless masked by these first.
+    """
+    width = 2 * size + 1
+    whole = (1 << width * width) - 1
+
+    first_rank = (1 << width) - 1
+    first_file = sum(1 << rank * width for rank in range(width))
+
+    return (
+        whole & ~(first_file << width - 1),  # all but the last file
+        whole >> width,  # all but the last rank
+        whole & ~first_file,  # all but the first file
+        whole & ~first_rank,  # all but the first rank
+    )
+
+
+@lru_cache(maxsize=None)
+def zobrist(size: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Random 64-bit keys for a black and a white stone on each intersection of a board of given size, in its flat layout.
+
+    The hash of a position is the exclusive or of the keys of its stones, so it is updated by one exclusive or per stone put or
+    lifted. Keys are seeded by size, so that hashes are reproducible.
+    """
+    random = Random(size)
+
+    return tuple(
+        tuple(
+            random.getrandbits(64) for _ in range((2 * size + 1) ** 2)
+        ) for _ in ("black", "white")
+    )
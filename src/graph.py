@@ -26,6 +26,7 @@ Undirected graph requires overriding some methods to account for symmetric edges
 """
 
 
+from collections import deque
 from typing import Any
 
 Node = Any  # Node type to be hashable to be used as keys.
@@ -38,6 +39,8 @@ Edges = frozenset[Edge]  # An edge list.
 
 Graph = dict[Node, Neighborhood]  # A graph as sets of neighborhoods keyed by their node.
 
+EMPTY = Nodes()  # A shared empty neighborhood to default to, read-only so that it cannot be filled by mistake.
+
 
 class Directed(Graph):
     """Directed graph.
@@ -64,6 +67,7 @@ class Directed(Graph):
         get: Redefine `dict.get` with empty empty neighborhood as default.
         add: Add or update node with neighborhood.
         clear: Clear unused (disconnected) nodes.
+        copy: Copy graph with its neighborhoods.
 
     Backend methods for operations:
         union/update: Unite graph with another.
@@ -79,17 +83,21 @@ class Directed(Graph):
         clusters: List sets of nodes that are connected internally but disconnected with one another.
     """
 
-    def __init__(self, *args, **kwargs):
-        """Update graph by removing self-edges."""
+    def __init__(self, *args, validated: bool = False, **kwargs):
+        """Update graph by removing self-edges.
+
+        Graphs validated already, like those made out of other graphs, have no self-edges to remove.
+        """
         super(Directed, self).__init__(*args, **kwargs)
 
     #   Remove self-edges.
-        for node in self:
-            self[node].discard(node)
+        if not validated:
+            for node in self:
+                self[node].discard(node)
 
     def __setitem__(self, node: Node, neighborhood: Neighborhood | None = None):
         """Add node with a neighborhood of nodes by removing possible self-edge."""
-        neighborhood = neighborhood or Neighborhood()
+        neighborhood = Neighborhood() if neighborhood is None else neighborhood
 
     #   Remove self-edge.
         neighborhood.discard(node)
@@ -107,6 +115,8 @@ class Directed(Graph):
         """Unite graph with another in-place."""
         self.update(other)
 
+        return self
+
     def __or__(self, other):
         """Unite graph with another."""
         return self.union(other)
@@ -115,6 +125,8 @@ class Directed(Graph):
         """Subtract graph from current in-place."""
         self.difference_update(other)
 
+        return self
+
     def __sub__(self, other):
         """Subtract graph from current."""
         return self.difference(other)
@@ -123,6 +135,8 @@ class Directed(Graph):
         """Intersect graph with another in-place."""
         self.intersection_update(other)
 
+        return self
+
     def __and__(self, other):
         """Intersect graph with another."""
         return self.intersection(other)
@@ -131,6 +145,8 @@ class Directed(Graph):
         """Complement graph union with graph intersection in-place."""
         self.symmetric_difference_update(other)
 
+        return self
+
     def __xor__(self, other):
         """Complement graph union with graph intersection."""
         return self.symmetric_difference(other)
@@ -163,8 +179,11 @@ class Directed(Graph):
 
     @classmethod
     def fromkeys(cls, nodes: Neighborhood, neighborhood: Neighborhood | None = None):
-        """Make graph from node iterable and given default neighborhood."""
-        return cls(Graph.fromkeys(nodes, neighborhood or Neighborhood()))
+        """Make graph from node iterable and given default neighborhood.
+
+        Each node gets a neighborhood of its own.
+        """
+        return cls({node: Neighborhood() if neighborhood is None else neighborhood.copy() for node in nodes})
 
     @classmethod
     def from_edge_list(cls, edge_list: Edges):
@@ -182,25 +201,47 @@ class Directed(Graph):
         get: Redefine `dict.get` with empty empty neighborhood as default.
         add: Add or update node with neighborhood.
         clear: Clear unused (disconnected) nodes.
+        copy: Copy graph with its neighborhoods.
     """
 
     def setdefault(self, node: Node, default_neighborhood: Neighborhood | None = None) -> Neighborhood:
-        """Redefine dictionary `dict.setdefault` with empty neighborhood as default."""
-        return super(Directed, self).setdefault(node, default_neighborhood or Neighborhood())
+        """Redefine dictionary `dict.setdefault` with empty neighborhood as default.
+
+        A new neighborhood is only made when the node is missing.
+        """
+        neighborhood = super(Directed, self).get(node)
+
+        if neighborhood is None:
+            neighborhood = Neighborhood() if default_neighborhood is None else default_neighborhood
+            super(Directed, self).setdefault(node, neighborhood)
+
+        return neighborhood
 
     def get(self, node: Node, default_neighborhood: Neighborhood | None = None) -> Neighborhood:
-        """Redefine `get` with empty empty neighborhood as default."""
-        return super(Directed, self).get(node, default_neighborhood or Neighborhood())
+        """Redefine `get` with empty empty neighborhood as default.
+
+        Missing nodes get the shared (read-only) empty neighborhood.
+        """
+        return super(Directed, self).get(node, EMPTY if default_neighborhood is None else default_neighborhood)
 
     def add(self, node: Node, neighbohood: Neighborhood):
         """Add or update node with neighborhood."""
         self.setdefault(node).update(neighbohood)
 
     def clear(self):
-        """Clear unused (disconnected) nodes."""
-        for node in self.copy():
-            if not self[node]:
-                del self[node]
+        """Clear unused (disconnected) nodes.
+
+        Disconnected nodes have no edges to remove along with them, so they are deleted from the dictionary directly.
+        """
+        for node in [node for node, neighborhood in self.items() if not neighborhood]:
+            super(Directed, self).__delitem__(node)
+
+    def copy(self):
+        """Copy graph with copies of its neighborhoods.
+
+        The copy is as clean as the graph itself, so it is not validated again.
+        """
+        return self.__class__({node: neighborhood.copy() for node, neighborhood in self.items()}, validated=True)
 
     """Backend methods for operations:
         union/update: Unite graph with another.
@@ -218,7 +259,7 @@ class Directed(Graph):
 
     def union(self, other):
         """Unite graph with another."""
-        undirected = self.__class__(self.copy())
+        undirected = self.copy()
         undirected.update(other)
 
         return undirected
@@ -229,38 +270,55 @@ class Directed(Graph):
             self.pop(node, neighbohood)  # Add node with neighborhood, symmetrically.
 
     def difference(self, other):
-        """Subtract graph from current."""
-        undirected = self.__class__(self.copy())
-        undirected.difference_update(other)
-
-        return undirected
+        """Subtract graph from current, keeping only the nodes missing from the other graph in one pass."""
+        return self.__class__(
+            {node: neighborhood.copy() for node, neighborhood in self.items() if node not in other}, validated=True
+        )
 
     def intersection_update(self, other):
-        """Intersect graph with another in-place in-place."""
-        self.difference_update(self.difference(other))
+        """Intersect graph with another in-place in-place.
+
+        Only the nodes missing from the other graph are popped.
+        """
+        for node in self.keys() - other.keys():
+            self.pop(node)
 
     def intersection(self, other):
-        """Intersect graph with another in-place."""
-        return self.difference(self.difference(other))
+        """Intersect graph with another in-place, keeping only the nodes common to both graphs in one pass."""
+        return self.__class__(
+            {node: neighborhood.copy() for node, neighborhood in self.items() if node in other}, validated=True
+        )
 
     def symmetric_difference_update(self, other):
         """Complement graph union with graph intersection in-place."""
+        common_nodes = Graph.fromkeys(self.keys() & other.keys())  # Before uniting, when all nodes of other become common.
+
         self.update(other)
-        self.difference_update(self.intersection(other))
+        self.difference_update(common_nodes)
 
     def symmetric_difference(self, other):
-        """Complement graph union with graph intersection."""
-        return self.union(other).difference(self.intersection(other))
+        """Complement graph union with graph intersection.
+
+        Only the nodes common to both graphs need subtracting from their union, not a whole intersection graph.
+        """
+        undirected = self.union(other)
+        undirected.difference_update(Graph.fromkeys(self.keys() & other.keys()))
+
+        return undirected
 
     def issubset(self, other):
-        """Check if the current graph is a subgraph of the other graph."""
-        return Neighborhood(self.keys()).issubset(Neighborhood(other.keys())) \
-            and all(self.get(node).issubset(other[node]) for node in other)
+        """Check if the current graph is a subgraph of the other graph.
+
+        Nodes are compared through key views first, without building sets out of them.
+        """
+        return self.keys() <= other.keys() and all(neighborhood <= other[node] for node, neighborhood in self.items())
 
     def issuperset(self, other):
-        """Check if the current graph is a supergraph of the other graph."""
-        return Neighborhood(self.keys()).issuperset(Neighborhood(other.keys())) \
-            and all(self[node].issuperset(other.get(node)) for node in self)
+        """Check if the current graph is a supergraph of the other graph.
+
+        Nodes are compared through key views first, without building sets out of them.
+        """
+        return self.keys() >= other.keys() and all(self[node] >= neighborhood for node, neighborhood in other.items())
 
     """Graph special methods:
         edge_list: List edges in graph as pairs of connected nodes.
@@ -271,27 +329,52 @@ class Directed(Graph):
 
     @property
     def edge_list(self) -> Edges:
-        """List edges in graph as pairs of connected nodes."""
-        return Edges((node, adjacent_node) for node in self for adjacent_node in self[node])
+        """List edges in graph as pairs of connected nodes, streamed off the neighborhoods."""
+        return Edges((node, adjacent_node) for node, neighborhood in self.items() for adjacent_node in neighborhood)
 
     def cluster(self, node: Node) -> Nodes:
-        """Get cluster node belong to."""
-        neighborhood = self.pop(node)
-        nodes = {node}.union(*(self.cluster(adjacent_node) for adjacent_node in neighborhood))
+        """Get cluster node belong to.
 
-    #   Stich graph back up when done (back-propagation)
-        self.add(node, neighborhood)
+        Nodes are visited breadth-first off a queue.
+        """
+        visited = Neighborhood({node})
+        queue = deque((node,))
+
+        while queue:
+            for adjacent_node in self.get(queue.popleft()):
+                if adjacent_node not in visited:
+                    visited.add(adjacent_node)
+                    queue.append(adjacent_node)
 
-        return Nodes(nodes)
+        return Nodes(visited)
 
     @property
     def clusters(self) -> Clusters:
-        """List disjoint subgraphs of inter-connected nodes."""
-        return Clusters(self.cluster(node) for node in self)
+        """List disjoint subgraphs of inter-connected nodes.
+
+        Each cluster is found once from its first node, leaving the graph as it is.
+        """
+        clusters = Clusters()
+        clustered = Neighborhood()
+
+        for node in self:
+            if node not in clustered:
+                cluster = self.cluster(node)
+                clustered.update(cluster)
+                clusters.add(cluster)
+
+        return clusters
 
     def boundary(self, cluster: Nodes) -> Nodes:
         """Get all nodes not in the cluster but connected to it."""
-        return Nodes().union(*(self[node] for node in cluster)).difference(cluster)
+        boundary = Neighborhood()
+
+        for node in cluster:
+            boundary |= self[node]
+
+        boundary.difference_update(cluster)
+
+        return Nodes(boundary)
 
 
 class Undirected(Directed):
@@ -300,22 +383,31 @@ class Undirected(Directed):
     Implement `Directed` methods to include symmetric edge operations where necessary.
     """
 
-    def __init__(self, *args, **kwargs):
-        """Update graph with missing symmetric edges and by removing self-edges."""
-        super(Undirected, self).__init__(*args, **kwargs)
+    def __init__(self, *args, symmetric: bool = False, validated: bool = False, **kwargs):
+        """Update graph with missing symmetric edges and by removing self-edges.
+
+        Graphs known to be symmetric already, like those of other undirected graphs, have no missing symmetric edges to add.
+        Validated graphs are symmetric too.
+        """
+        super(Undirected, self).__init__(*args, validated=validated, **kwargs)
 
-    #   Add missing symmetric edges.
-        self.update(self.copy())
+    #   Add missing symmetric edges only, in one pass over a snapshot of the neighborhoods as missing nodes may be added.
+        if not symmetric and not validated:
+            for node, neighborhood in tuple(self.items()):
+                for adjacent_node in neighborhood:
+                    self.setdefault(adjacent_node).add(node)
 
     def __setitem__(self, node: Node, neighborhood: Neighborhood | None = None):
         """Add node with a neighborhood of nodes by adding the missing symmetric edges and removing possible self-edge."""
-        neighborhood = neighborhood or Neighborhood()
+        neighborhood = Neighborhood() if neighborhood is None else neighborhood
 
     #   Remove self-edge.
         neighborhood.discard(node)
 
-    #   Remove hanging edges if any and add new missing symmetric ones.
-        self.pop(node, neighborhood)
+    #   Remove hanging edges if any (only an existing node has any) and add new missing symmetric ones.
+        if node in self:
+            self.pop(node)
+
         self.add(node, neighborhood)
 
     def __delitem__(self, node: Node):
@@ -325,6 +417,7 @@ class Undirected(Directed):
     """Fundamental methods for operations:
         add: Add or update node with neighborhood and symmetric edges.
         pop: Delete node with neighborhood and symmetric edges and return neighborhood.
+        update: Unite graph with another in-place, adding symmetric edges unless known to be there.
     """
 
     def add(self, node: Node, neighbohood: Neighborhood):
@@ -335,9 +428,22 @@ class Undirected(Directed):
         for adjacent_node in neighbohood:
             self.setdefault(adjacent_node).add(node)
 
+    def update(self, other, symmetric: bool = False):
+        """Unite graph with another in-place.
+
+        Neighborhoods of a graph known to be symmetric already come with their symmetric edges, so they are added as they are.
+        """
+        add = super(Undirected, self).add if symmetric else self.add
+
+        for node, neighbohood in other.items():
+            add(node, neighbohood)
+
     def pop(self, node: Node, default_neighborhood: Neighborhood | None = None) -> Neighborhood:  # type: ignore
-        """Delete node with neighborhood and symmetric edges and return neighborhood."""
-        neighborhood = super(Undirected, self).pop(node, default_neighborhood or Neighborhood())
+        """Delete node with neighborhood and symmetric edges and return neighborhood.
+
+        Missing nodes pop the shared (read-only) empty neighborhood.
+        """
+        neighborhood = super(Undirected, self).pop(node, EMPTY if default_neighborhood is None else default_neighborhood)
 
     #   Remove symmetric edges.
         for adjacent_node in neighborhood:
@@ -350,3 +456,40 @@ class Undirected(Directed):
         node, neighborhood = super(Undirected, self).popitem()
 
         return node, self.pop(node, neighborhood)  # Remove traces of popped node from adjacent nodes.
+
+    """Backend methods for operations:
+        union: Unite graph with another, adding symmetric edges unless known to be there.
+        difference: Subtract graph from current, without edges to the subtracted nodes.
+        intersection: Intersect graph with another, without edges to the nodes left out.
+        symmetric_difference: Complement graph union with graph intersection, without edges to the common nodes.
+    """
+
+    def union(self, other):
+        """Unite graph with another, adding symmetric edges only if the other graph is not undirected already."""
+        undirected = self.copy()
+        undirected.update(other, symmetric=isinstance(other, Undirected))
+
+        return undirected
+
+    def difference(self, other):
+        """Subtract graph from current, keeping only the nodes missing from the other graph and the edges among them."""
+        nodes = self.keys() - other.keys()
+
+        return self.__class__({node: self[node] & nodes for node in nodes}, validated=True)
+
+    def intersection(self, other):
+        """Intersect graph with another, keeping only the nodes common to both graphs and the edges among them."""
+        nodes = self.keys() & other.keys()
+
+        return self.__class__({node: self[node] & nodes for node in nodes}, validated=True)
+
+    def symmetric_difference(self, other):
+        """Complement graph union with graph intersection, in one pass over the nodes of either graph but not both."""
+        common_nodes = self.keys() & other.keys()
+
+        return self.__class__(
+            {
+                node: neighborhood - common_nodes for graph in (self, other)
+                for node, neighborhood in graph.items() if node not in common_nodes
+            }, validated=isinstance(other, Undirected)
+        )
@@ -5,10 +5,10 @@ adjacent if they are distinct and connected by a horizontal or vertical line wit
 """
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Intersection:
     """An intersection (point).
 
@@ -21,19 +21,25 @@ class Intersection:
         rank: The position of the intersection vertically.
         size: Factor to size the board from -size to +size.
             default: The standard Go board size.
+        offset: The position of the intersection in the flat (rank-major) layout of a board of its size.
     """
 
     file: int  # Ranges from -size to +size.
     rank: int  # Ranges from -size to +size.
     size: int = 9  # True size of the board is always an odd number (2 * size + 1).
+    offset: int = field(init=False, repr=False, compare=False)  # Ranges from 0 to (2 * size + 1) ** 2 - 1.
 
     def __post_init__(self):
         """Size must be positive."""
         object.__setattr__(self, 'size', abs(self.size))
+        object.__setattr__(self, 'offset', (self.rank + self.size) * (2 * self.size + 1) + (self.file + self.size))
 
     def __hash__(self):
-        """Hash based on rank and file only."""
-        return hash((self.file, self.rank))
+        """Hash based on rank and file only, through the cached offset.
+
+        Unlike hashing a tuple of file and rank, where -1 and -2 hash the same, offsets never collide on the board.
+        """
+        return self.offset
 
     def __bool__(self) -> bool:
         """Intersection must be within board boundaries."""
@@ -6,14 +6,14 @@ to be insufficient, extra stones will be used.
 
 
 from dataclasses import dataclass
-from enum import IntFlag, unique
+from enum import IntEnum, unique
 from typing import Hashable
 
 from .intersection import Intersection
 
 
 @unique
-class Color(IntFlag):
+class Color(IntEnum):
     """Color of an intersection."""
 
     black = +1
@@ -21,19 +21,29 @@ class Color(IntFlag):
     white = -1
 
     def __repr__(self) -> str:
-        """Each color is actually a puc."""
-        return {
-            +1: "\U000026AB",
-            00: "\U0001F7E4",
-            -1: "\U000026AA",
-        }[self]
-
-    def __ne__(self, other) -> bool:
-        """Empty squares are foes with one another."""
+        """Each color is actually a puc, looked up by value."""
+        return glyphs[self + 1]
+
+    def foe(self, other) -> bool:
+        """Black and white are foes with one another, while empty is foe with none.
+
+        Kept apart from `!=`, which is plain inequality of colors.
+        """
         return abs(self - other) == 2
 
 
-@dataclass(repr=False, eq=False)
+#   Pucs of colors, white, empty and black in order, indexed by value shifted by one.
+glyphs: tuple[str, str, str] = (
+    "\U000026AA",
+    "\U0001F7E4",
+    "\U000026AB",
+)
+
+#   Colors by name, in a plain dictionary.
+colors_by_name: dict[str, Color] = {color.name: color for color in Color.__members__.values()}
+
+
+@dataclass(repr=False, slots=True)
 class Stone(Intersection):
     """A stone.
 
@@ -49,20 +59,25 @@ class Stone(Intersection):
 
     def __post_init__(self):
         """Translate descriptive input."""
-        self.color = Color[self.color] if isinstance(self.color, str) else self.color
+        super(Stone, self).__post_init__()
+
+        self.color = colors_by_name[self.color] if isinstance(self.color, str) else self.color
 
     def __repr__(self):
         """Assume color appearance."""
         return repr(self.color)
 
     def __hash__(self):
-        """Hash only based on intersection."""
+        """Hash only based on intersection, which equal stones share."""
         return super(Stone, self).__hash__()
 
-    def __eq__(self, other):
-        """Compare based on allegiance only."""
+    def friend(self, other) -> bool:
+        """Compare based on allegiance only.
+
+        Kept apart from `==`, which compares stones by both intersection and color.
+        """
         return self.color == other.color
 
-    def __ne__(self, other):
+    def foe(self, other) -> bool:
         """Compare based on allegiance only."""
-        return self.color != other.color
+        return self.color.foe(other.color)
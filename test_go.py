@@ -1,12 +1,19 @@
 """Tests for Go engine."""
 
 
+import pytest
+
+from src.goban import Board, adjacencies, neighborhoods
+from src.graph import Clusters, Edges, Neighborhood, Nodes, Undirected
+from src.intersection import Intersection
+from src.stone import Color, Stone
+
+
 class TestStone:
     """Test stone placement."""
 
     def test_color(self):
-        """Test allegiance."""
-        from src.stone import Stone
+        """Test hashing and equality of stones."""
 
     #   Assert intersections are properly hashed.
         assert len(
@@ -17,26 +24,49 @@ class TestStone:
             }
         ) == 3
 
-    #   Same color means friends even on a different intersection.
-        assert Stone(-1, +1, color="white") == Stone(+1, -1, color="white")
-        assert Stone(-1, +1, color="black") == Stone(+1, -1, color="black")
-        assert Stone(-1, +1, color="empty") == Stone(+1, -1, color="empty")
-
-    #   Different color means foes even on the same intersection.
-        assert Stone(00, 00, color="white") != Stone(00, 00, color="black")
-        assert Stone(00, 00, color="black") != Stone(00, 00, color="white")
-
-    #   Empty is not friend:
-        assert not Stone(00, 00, color="white") == Stone(00, 00, color="empty")
-        assert not Stone(00, 00, color="black") == Stone(00, 00, color="empty")
-        assert not Stone(00, 00, color="empty") == Stone(00, 00, color="white")
-        assert not Stone(00, 00, color="empty") == Stone(00, 00, color="black")
-
-    #   Empty is not foe:
-        assert not Stone(00, 00, color="white") != Stone(00, 00, color="empty")
-        assert not Stone(00, 00, color="black") != Stone(00, 00, color="empty")
-        assert not Stone(00, 00, color="empty") != Stone(00, 00, color="white")
-        assert not Stone(00, 00, color="empty") != Stone(00, 00, color="black")
+    #   Intersections with coordinates whose hashes coincide (-1 and -2) should still hash apart.
+        assert len(
+            {
+                Stone(-1, 00),
+                Stone(-2, 00),
+            }
+        ) == 2
+
+    #   Stones are slotted like intersections, with no instance dictionary.
+        assert not hasattr(Stone(00, 00), "__dict__")
+
+    #   Stones are equal only on the same intersection with the same color.
+        assert Stone(00, 00, color="white") == Stone(00, 00, color="white")
+        assert Stone(00, 00, color="white") != Stone(00, 00, color="empty")
+        assert Stone(-1, +1, color="white") != Stone(+1, -1, color="white")
+
+    #   Stones are not plain intersections, whatever their color.
+        assert Stone(00, 00, color="white") != Intersection(00, 00)
+        assert len({Intersection(00, 00), Stone(00, 00, color="white"), Stone(00, 00, color="black")}) == 3
+
+    @pytest.mark.parametrize(
+        "color, other_color, friends, foes",
+        [
+        #   Same color means friends, even empty.
+            ("white", "white", True, False),
+            ("black", "black", True, False),
+            ("empty", "empty", True, False),
+        #   Different color means foes.
+            ("white", "black", False, True),
+            ("black", "white", False, True),
+        #   Empty is neither friend nor foe.
+            ("white", "empty", False, False),
+            ("black", "empty", False, False),
+            ("empty", "white", False, False),
+            ("empty", "black", False, False),
+        ],
+    )
+    def test_allegiance(self, color, other_color, friends, foes):
+        """Test allegiance, the same on the same intersection as on different ones."""
+        assert Stone(00, 00, color=color).friend(Stone(00, 00, color=other_color)) == friends
+        assert Stone(-1, +1, color=color).friend(Stone(+1, -1, color=other_color)) == friends
+        assert Stone(00, 00, color=color).foe(Stone(00, 00, color=other_color)) == foes
+        assert Stone(-1, +1, color=color).foe(Stone(+1, -1, color=other_color)) == foes
 
 
 class TestIntersection:
@@ -44,7 +74,6 @@ class TestIntersection:
 
     def test_init(self):
         """Test proper generation of intersections."""
-        from src.intersection import Intersection
 
     #   Assert size does stay positive.
         assert Intersection(0, 0, -9).size == 9
@@ -58,7 +87,6 @@ class TestIntersection:
 
     def test_operations(self):
         """Test intersection vector operations."""
-        from src.intersection import Intersection
 
     #   Binary operations:
         assert Intersection(-1, +2, 0) + Intersection(-3, +4, 0) == Intersection(-4, +6, 0)
@@ -73,12 +101,35 @@ class TestIntersection:
         assert -Intersection(-3, +4, 0) == Intersection(+3, -4, 0)
 
 
+@pytest.fixture(scope="module")
+def graph() -> Undirected:
+    """Graph with self-edges and missing symmetric edges, for the undirected graph to fix, built once for all tests.
+
+    Tests changing the graph work on a copy of it.
+    """
+    return Undirected(
+        {
+            1: {
+                1,  # self-reference
+                2,  # includes symmetric
+            },
+            2: {
+                1,  # includes symmetric
+                4,  # misses symmetric with node missing
+            },
+            3: {
+                1,  # misses symmetric but node included
+                3,  # self-reference
+            },
+        }
+    )
+
+
 class TestUndirected:
     """Test (undirected) Graph objects."""
 
     def test_init(self):
         """Test graph creation."""
-        from src.graph import Neighborhood, Undirected
 
         graph = Undirected.fromkeys(
             {
@@ -92,33 +143,46 @@ class TestUndirected:
         for node in graph:
             assert graph[node] == Neighborhood()
 
+    #   Isolated nodes do not share their neighborhoods.
+        graph.add(1, {2})
+        assert graph == {1: {2}, 2: {1}, 3: set()}
+        graph.pop(1)
+
     #   Graph will be empty after clearing, as no pair of nodes is connected.
         graph.clear()
         assert graph == Undirected()
 
+    #   Clearing keeps connected nodes, mixed with disconnected ones.
+        graph = Undirected({1: {2}, 3: set(), 4: {5}, 6: set()})
+        graph.clear()
+        assert graph == {1: {2}, 2: {1}, 4: {5}, 5: {4}}
+
     #   Graph should be reproducible from its own edgelist.
         assert graph == Undirected.from_edge_list(graph.edge_list)
 
-    def test_set(self):
+    #   Missing symmetric edges are added unless the graph is known to be symmetric.
+        assert Undirected({1: {2}}) == {1: {2}, 2: {1}}
+        assert Undirected({1: {2}, 2: {1}}, symmetric=True) == {1: {2}, 2: {1}}
+
+    #   Self-edges are removed unless the graph is validated already.
+        assert Undirected({1: {1, 2}}) == {1: {2}, 2: {1}}
+        assert Undirected({1: {2}, 2: {1}}, validated=True) == {1: {2}, 2: {1}}
+
+        graph = Undirected({1: {2}})
+        graph.update({2: {3}, 3: {2}}, symmetric=True)
+        assert graph == {1: {2}, 2: {1, 3}, 3: {2}}
+
+    #   Copies are graphs of their own, not sharing neighborhoods.
+        graph_copy = graph.copy()
+        assert isinstance(graph_copy, Undirected) and graph_copy == graph
+
+        graph_copy.add(1, {3})
+        assert graph == {1: {2}, 2: {1, 3}, 3: {2}}
+
+    def test_set(self, graph):
         """Test setting and updating methods."""
-        from src.graph import Neighborhood, Undirected
+        graph = graph.copy()
 
-        graph = Undirected(
-            {
-                1: {
-                    1,  # self-reference
-                    2,  # includes symmetric
-                },
-                2: {
-                    1,  # includes symmetric
-                    4,  # misses symmetric with node missing
-                },
-                3: {
-                    1,  # misses symmetric but node included
-                    3,  # self-reference
-                },
-            }
-        )
         should_be = {
             1: {
                 2,
@@ -151,26 +215,14 @@ class TestUndirected:
         assert graph.setdefault(6, {4}) == {4}  # Node 6 does not exist, so set the default {4}.
         assert graph.setdefault(7) == Neighborhood()  # Node 7 does not exist, so set the default empty set.
 
-    def test_get(self):
-        """Test getting methods."""
-        from src.graph import Undirected
+    #   Test setting nodes, new and old.
+        graph[8] = {1, 9}  # Node 8 does not exist and neither does node 9.
+        assert 8 in graph[1] and 8 in graph[9]
+        graph[8] = {2}  # Node 8 exists, so its old edges go.
+        assert 8 not in graph[1] and 8 not in graph[9] and 8 in graph[2]
 
-        graph = Undirected(
-            {
-                1: {
-                    1,  # self-reference
-                    2,  # includes symmetric
-                },
-                2: {
-                    1,  # includes symmetric
-                    4,  # misses symmetric with node missing
-                },
-                3: {
-                    1,  # misses symmetric but node included
-                    3,  # self-reference
-                },
-            }
-        )
+    def test_get(self, graph):
+        """Test getting methods."""
 
     #   Test how normal key access returns neighborhoods.
         assert graph[1] == {
@@ -187,28 +239,9 @@ class TestUndirected:
         }  # Node 1 exists, so get its proper neighborhood.
         assert graph.get(5, {4}) == {4}  # Node 5 does not exist, so get the default {4}.
 
-    def test_del(self):
+    def test_del(self, graph):
         """Test deleting methods."""
-        from src.graph import Undirected
-
-        graph = Undirected(
-            {
-                1: {
-                    2,
-                    3,
-                },
-                2: {
-                    1,
-                    4,
-                },
-                3: {
-                    1,
-                },
-                4: {
-                    2,
-                }
-            }
-        )
+        graph = graph.copy()  # The symmetric graph of the fixture, which deleting would otherwise change for other tests.
 
     #   Plain-delete node 4 and connected edges.
         del graph[4]
@@ -229,9 +262,111 @@ class TestUndirected:
         graph.clear()
         assert graph == Undirected()
 
+    def test_compare(self):
+        """Test subgraph and supergraph comparisons."""
+
+        graph = Undirected(
+            {
+                1: {
+                    2,
+                    3,
+                },
+                4: {
+                    5,
+                },
+            }
+        )
+        subgraph = Undirected(
+            {
+                1: {
+                    2,
+                },
+            }
+        )
+
+    #   A graph is a (non-strict) subgraph and supergraph of itself.
+        assert graph <= graph
+        assert graph >= graph
+        assert not graph < graph
+
+    #   Missing edges and nodes make a strict subgraph.
+        assert subgraph < graph
+        assert graph > subgraph
+        assert not graph <= subgraph
+        assert not subgraph >= graph
+
+    def test_operations(self):
+        """Test set operations on graphs."""
+
+        graph = Undirected(
+            {
+                1: {
+                    2,
+                },
+                3: {
+                    4,
+                },
+            }
+        )
+        other_graph = Undirected(
+            {
+                2: {
+                    5,
+                },
+                6: {
+                    7,
+                },
+            }
+        )
+
+    #   Nodes in both graphs, without edges to the rest, leaving the graph itself intact.
+        assert graph & other_graph == {2: set()}
+        assert graph == {1: {2}, 2: {1}, 3: {4}, 4: {3}}
+
+    #   Nodes in the graph but not the other, without edges to the rest, leaving the graph itself intact.
+        assert graph - other_graph == {1: set(), 3: {4}, 4: {3}}
+        assert graph == {1: {2}, 2: {1}, 3: {4}, 4: {3}}
+
+    #   Nodes in either graph, leaving the graph itself intact.
+        assert graph | other_graph == {1: {2}, 2: {1, 5}, 3: {4}, 4: {3}, 5: {2}, 6: {7}, 7: {6}}
+        assert graph == {1: {2}, 2: {1}, 3: {4}, 4: {3}}
+
+    #   Nodes in either graph but not both, without edges to the common ones.
+        should_be = {
+            1: set(),
+            3: {
+                4,
+            },
+            4: {
+                3,
+            },
+            5: set(),
+            6: {
+                7,
+            },
+            7: {
+                6,
+            },
+        }
+        assert graph ^ other_graph == should_be
+
+    #   The same in-place.
+        graph.symmetric_difference_update(other_graph)
+        assert graph == should_be
+
+    #   In-place operators keep the graph they update bound to its name.
+        graph = Undirected({1: {2}})
+        graph |= Undirected({2: {3}})
+        assert isinstance(graph, Undirected) and graph == {1: {2}, 2: {1, 3}, 3: {2}}
+        graph -= Undirected({3: set()})
+        assert isinstance(graph, Undirected) and graph == {1: {2}, 2: {1}}
+        graph &= Undirected({1: set(), 2: set()})
+        assert isinstance(graph, Undirected) and graph == {1: {2}, 2: {1}}
+        graph ^= Undirected({2: set(), 4: set()})
+        assert isinstance(graph, Undirected) and graph == {1: set(), 4: set()}
+
     def test_special(self):
         """Test methods related to clustering and edge listing."""
-        from src.graph import Clusters, Edges, Neighborhood, Nodes, Undirected
 
         graph = Undirected(
             {
@@ -290,6 +425,10 @@ class TestUndirected:
         for node in graph:
             assert node in graph.cluster(node)
 
+    #   Clusters longer than the recursion limit are found all the same.
+        chain = Undirected({node: {node + 1} for node in range(10000)})
+        assert len(chain.cluster(0)) == 10001
+
     #   Check edgelist.
         assert graph.edge_list == Edges(
             {
@@ -315,3 +454,363 @@ class TestUndirected:
                 (8, 9), (9, 8),
             }
         )
+
+
+class TestBoard:
+    """Test Board objects."""
+
+    def test_init(self):
+        """Test board topology."""
+
+        board = Board(2)
+
+    #   Board neighborhoods should need no symmetric edges filled in.
+        assert board == Board(2)
+        assert dict(board) == dict(Undirected({node: set(neighborhood) for node, neighborhood in board.items()}))
+        assert len(board) == len(board.points)
+
+    #   Boards the same size share their topology.
+        assert all(board[point] is Board(2)[point] for point in board.points)
+
+    #   Which is why it cannot be changed, not even through a copy, but a plain graph of it can.
+        for change in (
+            lambda board: board.pop(board.points[0]),
+            lambda board: board.add(board.points[0], {board.points[2]}),
+            lambda board: board.__setitem__(board.points[0], set()),
+            lambda board: board.__delitem__(board.points[0]),
+            lambda board: board.clear(),
+            lambda board: board[board.points[1]].add(board.points[3]),
+        ):
+            for changed_board in (board, board.copy()):
+                with pytest.raises((TypeError, AttributeError)):
+                    change(changed_board)
+
+        assert dict(board) == dict(Board(2))
+        assert board.graph() == dict(Board(2)) and isinstance(board.graph(), Undirected)
+
+        graph = board.graph()
+        graph.pop(board.points[0])
+        assert dict(board) == dict(Board(2)) and board.points[0] in Board(2)[board.points[1]]
+
+    #   Set operations on the topology make plain graphs.
+        assert board - Undirected({board.points[0]: set()}) == graph
+        assert isinstance(board & graph, Undirected) and board & graph == graph
+        assert isinstance(board | graph, Undirected) and board | graph == board.graph()
+
+    #   Board edges are those of its graph, which cannot go stale as the topology cannot change.
+        assert board.edge_list == Undirected.edge_list.fget(board) == board.graph().edge_list
+
+        with pytest.raises(TypeError):
+            board.pop(board.points[0])
+
+        assert board.edge_list == Board(2).graph().edge_list
+
+    def test_stone(self):
+        """Test constant time access to stones by intersection."""
+
+        board = Board(2)
+
+    #   Every intersection is laid out once, so every stone should be found right where it is.
+        for file in board.range:
+            for rank in board.range:
+                stone = board.stone(Intersection(file, rank, board.size))
+
+                assert (stone.file, stone.rank) == (file, rank)
+                assert stone.color == Color.empty
+
+    #   Stones put on the board can be found back in their place.
+        board.put(Stone(-1, +2, board.size, color="white"))
+        assert board.stone(Intersection(-1, +2, board.size)).color == Color.white
+        assert board.stone(Intersection(+2, -1, board.size)).color == Color.empty
+
+    #   Stones off the board or meant for a board of another size are neither put nor found, and leave the board as it was.
+        position = board.snapshot()
+
+        for stone in (
+            Stone(+3, 00, board.size, color="black"),
+            Stone(00, -3, board.size, color="black"),
+            Stone(-3, -3, board.size, color="black"),
+            Stone(00, 00, board.size + 1, color="black"),
+        ):
+            with pytest.raises(ValueError):
+                board.put(stone)
+
+            with pytest.raises(ValueError):
+                board.stone(stone)
+
+        assert board.snapshot() == position
+
+    def test_adjacencies(self):
+        """Test board geometry."""
+
+        size = 2
+        width = 2 * size + 1
+
+    #   Corners have two neighbors, edges three and the rest four.
+        assert len(adjacencies(size)[0]) == 2
+        assert len(adjacencies(size)[1]) == 3
+        assert len(adjacencies(size)[width + 1]) == 4
+
+    #   Adjacency is symmetric.
+        for index, adjacency in enumerate(adjacencies(size)):
+            for adjacent_index in adjacency:
+                assert index in adjacencies(size)[adjacent_index]
+
+    #   Bitboard neighborhoods list the same neighbors.
+        for adjacency, neighborhood in zip(adjacencies(size), neighborhoods(size)):
+            assert neighborhood == sum(1 << adjacent_index for adjacent_index in adjacency)
+
+    #   Intersections are adjacent exactly when an edge of the board joins them.
+        board = Board(size)
+
+        for node in board:
+            for other_node in board:
+                assert board.adjacent(node, other_node) == (other_node in board[node])
+
+    def test_around(self):
+        """Test bitboard neighborhoods."""
+
+        board = Board(2)
+
+    #   Bitboard neighborhoods should agree with graph ones.
+        for point in board.points:
+            assert board.around(1 << board.index(point)) == sum(1 << board.index(neighbor) for neighbor in board[point])
+
+    #   A whole rank is surrounded by the ranks on either side of it.
+        rank = sum(1 << board.index(Intersection(file, 0, board.size)) for file in board.range)
+        assert board.around(rank) == rank << 2 * board.size + 1 | rank >> 2 * board.size + 1
+
+    def test_copy(self):
+        """Test copying board positions."""
+
+        board = Board(2)
+        board.put(Stone(+1, +1, board.size, color="black"))
+
+    #   A copy has the same topology and position.
+        board_copy = board.copy()
+        assert board_copy == board
+        assert board_copy.stone(Stone(+1, +1, board.size)).color == Color.black
+
+    #   Changing the position of a copy leaves the original alone.
+        board_copy.put(Stone(+1, +1, board.size, color="white"))
+        assert board.stone(Stone(+1, +1, board.size)).color == Color.black
+        assert board_copy != board
+
+    def test_random(self):
+        """Test random board positions."""
+
+        board = Board.random(2)
+
+    #   Random boards are proper boards with stones on them.
+        assert dict(board) == dict(Board(2))
+        assert board.black | board.white | board.empty == (1 << len(board.points)) - 1
+
+    #   Random boards hash the same as the same position put together stone by stone.
+        other_board = Board(2)
+
+        for point in board.points:
+            other_board.put(board.stone(point))
+
+        assert hash(other_board) == hash(board) and other_board == board
+
+    #   Drawings show the stone on every intersection, rank after rank.
+        assert "".join(row[4:-4] for row in repr(board).splitlines()[3:-2]) == \
+            "".join(repr(board.stone(point)) for point in board.points)
+
+    #   Groups built stone by stone agree with groups found from scratch.
+        groups = set(board.groups.values())
+        board.regroup()
+        assert set(board.groups.values()) == groups
+
+    #   Seeded random boards are reproducible.
+        assert Board.random(2, seed=0) == Board.random(2, seed=0)
+
+    #   Random boards are boards of the class they are made from.
+        class Goban(Board):
+            pass
+
+        assert type(Goban.random(2, seed=0)) is Goban and Goban.random(2, seed=0) == Board.random(2, seed=0)
+
+    def test_hash(self):
+        """Test hashing board positions."""
+
+        board = Board(2)
+        other_board = Board(2)
+
+    #   The same position reached in different ways hashes the same.
+        board.put(Stone(+1, +1, board.size, color="black"))
+        board.put(Stone(-1, -1, board.size, color="white"))
+        other_board.put(Stone(-1, -1, board.size, color="black"))
+        other_board.put(Stone(-1, -1, board.size, color="white"))
+        other_board.put(Stone(+1, +1, board.size, color="black"))
+        assert hash(board) == hash(other_board)
+        assert board == other_board
+        assert board.snapshot() == other_board.snapshot()
+
+    #   Putting the same stone again changes nothing.
+        board.put(Stone(+1, +1, board.size, color="black"))
+        assert hash(board) == hash(other_board)
+        assert board == other_board
+
+    #   Lifting all stones brings the hash back to that of an empty board.
+        board.put(Stone(+1, +1, board.size, color="empty"))
+        board.put(Stone(-1, -1, board.size, color="empty"))
+        assert hash(board) == hash(Board(2))
+        assert board == Board(2)
+
+    #   Boards are never equal to anything but boards, not even their own topology.
+        assert board != dict(board)
+        assert board != None
+
+    #   Boards compare as graphs by topology alone, so no board is both a strict subgraph and a strict supergraph of another.
+        random_board = Board.random(2, seed=0)
+
+        for other in (Board(2), random_board.graph(), Board(3)):
+            assert not (random_board < other and random_board > other)
+
+        assert random_board <= Board(2) and random_board >= Board(2) and not random_board < Board(2) and not random_board > Board(2)
+        assert not random_board < random_board.graph() and not random_board > random_board.graph()
+
+        graph = random_board.graph()
+        graph.pop(random_board.points[0])
+        assert random_board > graph and graph < random_board and not random_board < graph
+
+    #   Snapshots tell positions apart without copying boards.
+        snapshot = board.snapshot()
+        board.put(Stone(00, 00, board.size, color="black"))
+        assert board.snapshot() != snapshot
+        board.put(Stone(00, 00, board.size, color="empty"))
+        assert board.snapshot() == snapshot
+
+    def test_bitboard(self):
+        """Test conversion between intersections and bitboards."""
+
+        board = Board(2)
+        points = set(board.points[::3])
+
+    #   Intersections should make it through a bitboard and back.
+        assert {board.points[offset] for offset in board.offsets(board.bitboard(points))} == points
+        assert list(board.offsets(board.bitboard(board.points))) == list(range(len(board.points)))
+
+    def test_cluster(self):
+        """Test clusters of intersections."""
+
+        board = Board(2)
+
+    #   The whole board is one cluster, the same one the graph would find.
+        assert board.cluster(board.points[7]) == Undirected(
+            {node: set(neighborhood) for node, neighborhood in board.items()}
+        ).cluster(board.points[7])
+        assert board.clusters == Clusters({Nodes(board.points)})
+
+    def test_boundary(self):
+        """Test boundaries of clusters of intersections."""
+
+        board = Board(2)
+
+    #   Boundaries through bitboards should agree with boundaries through neighborhoods.
+        for cluster in (board.points[:1], board.points[6:9], board.points[::2]):
+            assert board.boundary(cluster) == Undirected.boundary(board, cluster)
+
+    #   Stones look up the intersections they are on.
+        stones = {board.stone(point) for point in board.points[6:9]}
+        assert Stone(00, 00, board.size) in board and Stone(+3, 00, board.size) not in board
+        assert board[Stone(00, 00, board.size)] == board.get(Stone(00, 00, board.size)) == board[Intersection(00, 00, board.size)]
+        assert board.boundary(stones) == board.boundary(board.points[6:9])
+
+    def test_liberties(self):
+        """Test liberties of stones."""
+
+        board = Board(1)
+
+    #   A stone in the center has four liberties until surrounded.
+        board.put(Stone(00, 00, board.size, color="black"))
+        assert board.liberties(board.black).bit_count() == 4
+
+        board.put(Stone(+1, 00, board.size, color="white"))
+        board.put(Stone(00, +1, board.size, color="white"))
+        assert board.liberties(board.black).bit_count() == 2
+
+    #   Liberties shared by stones count once.
+        board.put(Stone(-1, 00, board.size, color="white"))
+        board.put(Stone(-1, -1, board.size, color="white"))
+        assert board.liberties(board.white).bit_count() == 4
+
+    #   Stones have liberties as long as any of their adjacent intersections is empty.
+        assert board.has_liberty(board.black)
+        assert board.has_liberty(board.white)
+        assert not board.has_liberty(0)
+
+    #   Stones without liberties are captives, along with the rest of their group.
+        assert not board.captives(board.black | board.white)
+        board.put(Stone(00, -1, board.size, color="white"))
+        assert board.captives(board.black | board.white) == board.black
+        board.put(Stone(+1, -1, board.size, color="black"))
+        board.put(Stone(-1, +1, board.size, color="black"))
+        board.put(Stone(+1, +1, board.size, color="black"))
+        assert board.captives(board.white) == board.white
+        assert not board.has_liberty(board.white)
+        assert board.captives(board.black) == board.black
+
+    def test_io(self, tmp_path):
+        """Test saving and loading board positions."""
+
+        board = Board.random(2, seed=0)
+
+    #   A saved board should load back the same.
+        board.save(tmp_path / "test.board")
+        loaded_board = Board.load(tmp_path / "test.board")
+        assert loaded_board == board
+        assert set(loaded_board.groups.values()) == set(board.groups.values())
+
+    #   Saved files keep the plain text layout, size first and then colors rank after rank.
+        lines = (tmp_path / "test.board").read_text().splitlines()
+        assert lines[0] == "2"
+        assert lines[1:] == [
+            " ".join(f"{board.stone(point).color:+d}" for point in board.points[offset:offset + board.width])
+            for offset in range(0, len(board.points), board.width)
+        ]
+
+    #   Files with too few or too many colors, or with values that are no colors, should not load.
+        colors = " ".join(lines[1:]).split()
+
+        for changed_colors in (colors[:-1], colors + ["00"], colors[:-1] + ["+2"]):
+            (tmp_path / "test.board").write_text("2\n" + " ".join(changed_colors))
+
+            with pytest.raises(ValueError):
+                Board.load(tmp_path / "test.board")
+
+    def test_group(self):
+        """Test grouping of connected stones."""
+
+        board = Board(2)
+
+    #   Stones of the same color next to each other form a group.
+        board.put(Stone(-1, 00, board.size, color="black"))
+        board.put(Stone(+1, 00, board.size, color="black"))
+        assert board.group(Stone(-1, 00, board.size)) != board.group(Stone(+1, 00, board.size))
+
+        board.put(Stone(00, 00, board.size, color="black"))
+        assert board.group(Stone(-1, 00, board.size)) == board.group(Stone(+1, 00, board.size)) == board.black
+
+    #   Stones of different color do not.
+        board.put(Stone(00, +1, board.size, color="white"))
+        assert board.group(Stone(00, +1, board.size)) == board.white
+
+    #   Lifting a stone may split a group.
+        board.put(Stone(00, 00, board.size, color="empty"))
+        assert board.group(Stone(-1, 00, board.size)).bit_count() == 1
+        assert board.group(Stone(00, 00, board.size)) == 0
+
+    #   Replacing a stone leaves it in a group of the other color, and the rest of the board grouped as before.
+        board.put(Stone(00, 00, board.size, color="black"))
+        board.put(Stone(00, 00, board.size, color="white"))
+        assert board.group(Stone(00, 00, board.size)) == board.white
+        assert board.group(Stone(+1, 00, board.size)).bit_count() == 1
+
+    #   Groups found from scratch agree with groups built stone by stone.
+        board.put(Stone(00, 00, board.size, color="black"))
+        groups = board.groups.copy()
+        board.regroup()
+        assert set(board.groups.values()) == set(groups.values())
+        assert board.group(Stone(-1, 00, board.size)) == board.black